@@ -9,6 +9,7 @@ The idea and the original implementation has been provided by
 """
 # Standard library imports
 import os
+import re
 import sys
 import time
 from pathlib import Path
@@ -25,50 +26,75 @@ home = str(Path.home())
 managed_dir_name = "Clean"
 folder_to_track = os.path.join(home, "Downloads")
 
-ignore_files = [".DS_Store", ".download", managed_dir_name]
+ignore_files = (".DS_Store", ".download", managed_dir_name)
+# one alternation compiled once: a single C-level scan per filename
+# instead of one substring search per pattern
+ignore_regex = re.compile("|".join(map(re.escape, ignore_files)))
+managed_dir_lower = managed_dir_name.lower()
 
 
 class MyHandler(FileSystemEventHandler):
-    def on_modified(self, event):
-        for filename_w_ext in os.listdir(folder_to_track):
-            filename_ext_lower = filename_w_ext.lower()
-            if filename_ext_lower != managed_dir_name.lower() and not any(
-                [pattern in filename_ext_lower for pattern in ignore_files]
-            ):
-                # try:
-                filename = os.path.splitext(filename_w_ext)[0]
-                extension = os.path.splitext(filename_ext_lower)[1] or "noname"
-
-                # get directory as per the extension
-                # get noname by default if file extension does not exist
-                ext_dir = extensions_dirs.get(
-                    extension, extensions_dirs.get("noname")
-                )
-
-                # get_source_path
-                src = uf.get_absolute_file_source_path(
-                    folder_to_track, filename_w_ext
-                )
-
-                # get_destination_path
-                dest = uf.get_absolute_file_destination_path(
-                    ext_dir, f'{filename}{extension}'
+    def on_created(self, event):
+        if not event.is_directory:
+            self._process_file(event.src_path)
+
+    def on_moved(self, event):
+        if not event.is_directory:
+            self._process_file(event.dest_path)
+
+    def _process_file(self, path):
+        # only handle files sitting directly in the tracked folder, like
+        # the previous directory scan did (files already moved into the
+        # managed directory must be left alone)
+        if os.path.dirname(os.path.normpath(path)) != os.path.normpath(
+            folder_to_track
+        ):
+            return
+
+        filename_w_ext = os.path.basename(path)
+        filename_ext_lower = filename_w_ext.lower()
+        if filename_ext_lower == managed_dir_lower or ignore_regex.search(
+            filename_ext_lower
+        ):
+            return
+
+        filename, extension = os.path.splitext(filename_w_ext)
+        extension = extension.lower() or "noname"
+
+        # get directory as per the extension
+        # get noname by default if file extension does not exist
+        ext_dir = extensions_dirs.get(extension, default_ext_dir)
+
+        # get_source_path
+        src = uf.get_absolute_file_source_path(
+            folder_to_track, filename_w_ext
+        )
+
+        # get_destination_path — resolve (and create) the month
+        # directory a single time, candidate names reuse it below
+        dest_dir = uf.get_destination_dir(ext_dir)
+        dest = os.path.join(dest_dir, f'{filename}{extension}')
+
+        # reserve a unique destination: O_CREAT|O_EXCL makes the kernel
+        # fail atomically on a name collision instead of racing a
+        # separate stat() probe against other writers
+        i = 0
+        extension = extension if extension != "noname" else ""
+        while True:
+            try:
+                fd = os.open(
+                    dest, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644
                 )
+                os.close(fd)
+                break
+            except FileExistsError:
+                i += 1
+                new_name = f"{filename}_{str(i)}"
+                dest = os.path.join(dest_dir, new_name + extension)
+        print(dest)
 
-                # if destination path exists rename the file name and
-                # check again
-                i = 0
-                extension = extension if extension != "noname" else ""
-                while os.path.isfile(dest):
-                    i += 1
-                    new_name = f"{filename}_{str(i)}"
-                    dest = uf.get_absolute_file_destination_path(
-                        ext_dir, new_name + extension
-                    )
-                print(dest)
-
-                # found file name unique move it
-                os.rename(src, dest)
+        # destination name is reserved: move the file over it atomically
+        os.replace(src, dest)
 
 
 if __name__ == "__main__":
@@ -76,6 +102,7 @@ if __name__ == "__main__":
     if len(args) == 3:
         folder_to_track = args[1]
         managed_dir_name = args[2]
+        managed_dir_lower = managed_dir_name.lower()
 
     managing_dir_abs_path = os.path.join(folder_to_track, managed_dir_name)
 
@@ -83,6 +110,7 @@ if __name__ == "__main__":
         uf.create_path(managing_dir_abs_path)
 
     extensions_dirs = uf.get_mapping_dict(managing_dir_abs_path)
+    default_ext_dir = extensions_dirs["noname"]
 
     event_handler = MyHandler()
     observer = Observer()
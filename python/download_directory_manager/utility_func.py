@@ -30,13 +30,14 @@ def create_path(path):
     pathlib.Path(path).mkdir(parents=True, exist_ok=True)
 
 
-def create_destination_file_path_with_year_month(ext_dir):
-    create_path(os.path.join(ext_dir, *get_month()))
+def get_destination_dir(ext_dir):
+    destination_dir = os.path.join(ext_dir, *get_month())
+    create_path(destination_dir)
+    return destination_dir
 
 
 def get_absolute_file_destination_path(ext_dir, new_name):
-    create_destination_file_path_with_year_month(ext_dir)
-    return os.path.join(ext_dir, *get_month(), new_name)
+    return os.path.join(get_destination_dir(ext_dir), new_name)
 
 
 def get_absolute_file_source_path(folder_to_track, file_name):
@@ -64,9 +64,8 @@ def check_password(short_hash, long_hash):
         fg="yellow",
         bold=True,
     )
-    response = requests.get(PASS_URL + short_hash)
-    lines = response.text.split()
-    for line in lines:
+    response = requests.get(PASS_URL + short_hash, stream=True)
+    for line in response.iter_lines(decode_unicode=True):
         if long_hash in line:
             num_times = "occurrences" if int(line[36:]) > 1 else "occurence"
             click.secho("Your password was found!", fg="red", bold=True)
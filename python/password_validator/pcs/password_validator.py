@@ -6,6 +6,7 @@ requirements or not.
 """
 # Standard library imports
 from abc import ABC
+from functools import lru_cache
 from string import ascii_letters, digits
 from typing import Callable
 
@@ -21,7 +22,30 @@ def extract_class_methods_validators(class_: Callable) -> list:
         `_has_`.
     """
     # limit scope of added functions to the custom ones: _has_...()
-    return [method for method in dir(class_) if method.startswith("_has_") is True]
+    methods = [method for method in dir(class_) if method.startswith("_has_") is True]
+    # run the O(1) length predicate before the ones scanning the password
+    methods.sort(key=lambda method: (method != "_has_valid_length", method))
+    return methods
+
+
+@lru_cache(maxsize=4096)
+def validate_password(class_: Callable, password: str) -> tuple:
+    """
+    Run every condition method of `class_` against `password` and return
+    a `(conditions_are_met, reasons)` tuple of tuples.
+
+    The outcome is a pure function of the class and the password, so
+    results are memoized: validating the same password again (retry
+    flows, batch validation, tests) skips the scans entirely.
+    """
+    instance = class_(password)
+    conditions_are_met = []
+    reasons = []
+    for method in instance.condition_methods:
+        condition_met, reason = getattr(instance, method)()
+        conditions_are_met.append(condition_met)
+        reasons.append(reason)
+    return tuple(conditions_are_met), tuple(reasons)
 
 
 def decorate_validation_errors(func: Callable) -> Callable:
@@ -57,21 +81,63 @@ class PasswordValidator(ABC):
     min_numbers: int  # min. number of digits required
     condition_methods: list  # list of conditions applied by subclasses
 
-    def is_valid(self) -> bool:
+    # Translation tables shared by all instances, keyed by the accepted
+    # special characters (empty string when a subclass has none).
+    _translation_tables: dict = {}
+    _tagged: str = None  # password with every character tagged by class
+
+    def _translation_table(self) -> dict:
+        """
+        Return a translation table mapping letters to "L", digits to "N"
+        and accepted special characters to "S", building it only once
+        per set of accepted special characters.
+        """
+        special_chars = getattr(self, "special_chars", "")
+        table = self._translation_tables.get(special_chars)
+        if table is None:
+            mapping = {character: "L" for character in ascii_letters}
+            mapping.update({character: "N" for character in digits})
+            mapping.update({character: "S" for character in special_chars})
+            table = str.maketrans(mapping)
+            self._translation_tables[special_chars] = table
+        return table
+
+    def _tagged_password(self) -> str:
+        """
+        Tag every character of the password in a single `str.translate`
+        pass so each character class can then be counted with a C-level
+        `str.count` instead of one Python loop per class.
+        """
+        if self._tagged is None:
+            self._tagged = self.password.translate(self._translation_table())
+        return self._tagged
+
+    def __init_subclass__(cls, **kwargs) -> None:
         """
-        Execute all the methods starting with an underscore, store their
-        Boolean result. If all the conditions are met, return True.
-        Otherwise, return False.
+        Build the list of condition methods once per subclass definition
+        instead of rescanning the class on every instantiation.
         """
-        conditions_are_met = []
-        reasons = []
-        for method in self.condition_methods:
-            class_method = getattr(self, method)
-            condition_met, reason = class_method()
-            conditions_are_met.append(condition_met)
-            reasons.append(reason)
-
-        self.print_unmet_conditions(reasons)
+        super().__init_subclass__(**kwargs)
+        cls.condition_methods = extract_class_methods_validators(cls)
+
+    def is_valid(self, explain: bool = True) -> bool:
+        """
+        Execute all the methods starting with an underscore (cheapest
+        condition first), store their Boolean result. If all the
+        conditions are met, return True. Otherwise, return False.
+
+        When `explain` is False, only the boolean is returned and
+        nothing is printed.
+
+        Results are memoized per (class, password) pair through
+        `validate_password`.
+        """
+        conditions_are_met, reasons = validate_password(
+            type(self), self.password
+        )
+
+        if explain:
+            self.print_unmet_conditions(reasons)
         return all(conditions_are_met)
 
     @staticmethod
@@ -94,12 +160,8 @@ class PasswordValidator(ABC):
         return (valid_length, invalid_reason)
 
     def _has_enough_letters(self) -> tuple:
-        count = 0
         invalid_reason = None
-        for character in self.password:
-            if character in ascii_letters:
-                count += 1
-        valid_count = count >= self.min_letters
+        valid_count = self._tagged_password().count("L") >= self.min_letters
 
         if not valid_count:
             plural = "" if self.min_letters <= 1 else "s"
@@ -109,12 +171,8 @@ class PasswordValidator(ABC):
         return (valid_count, invalid_reason)
 
     def _has_enough_numbers(self) -> tuple:
-        count = 0
         invalid_reason = None
-        for character in self.password:
-            if character in digits:
-                count += 1
-        valid_count = count >= self.min_numbers
+        valid_count = self._tagged_password().count("N") >= self.min_numbers
 
         if not valid_count:
             plural = "" if self.min_numbers <= 1 else "s"
@@ -130,9 +188,6 @@ class PasswordValidatorRegularUser(PasswordValidator):
         self.min_length = 10
         self.min_letters = 1
         self.min_numbers = 1
-        self.condition_methods = extract_class_methods_validators(
-            PasswordValidatorRegularUser
-        )
         super().__init__()
 
 
@@ -144,18 +199,13 @@ class PasswordValidatorAdminUser(PasswordValidator):
         self.min_numbers = 1
         self.min_special_char = 3
         self.special_chars = "!@#$%^&*"  # list of accepted special characters
-        self.condition_methods = extract_class_methods_validators(
-            PasswordValidatorAdminUser
-        )
         super().__init__()
 
     def _has_enough_special_characters(self) -> tuple:
-        count = 0
         invalid_reason = None
-        for character in self.password:
-            if character in self.special_chars:
-                count += 1
-        valid_count = count >= self.min_special_char
+        valid_count = (
+            self._tagged_password().count("S") >= self.min_special_char
+        )
         if not valid_count:
             plural = "" if self.min_special_char <= 1 else "s"
             invalid_reason = (
@@ -1,9 +1,30 @@
 import os
+from functools import lru_cache
 from pathlib import Path
 
 from osxphotos.cli.export import export_cli
 
 
+@lru_cache(maxsize=None)
+def _resolve_dst(env_var_name: str) -> Path:
+    """Resolve and create the destination directory named by
+    `env_var_name`, caching the result so repeated instantiations skip
+    the env read and the mkdir syscall."""
+    dst_path = os.getenv(env_var_name, "")
+
+    if not dst_path:
+        raise ValueError(f"'{env_var_name}' is not set")
+
+    try:
+        os.makedirs(dst_path, exist_ok=True)
+    except OSError as e:
+        raise OSError(
+            f"Could not create directory {env_var_name}={dst_path}"
+        ) from e
+
+    return Path(dst_path)
+
+
 class ApplePhotosExport:
     def __init__(self, testing: bool):
         # Set a couple of flags when testing
@@ -30,18 +51,4 @@ class ApplePhotosExport:
         )
 
     def _set_up_paths(self) -> None:
-        dst_path = "APPLE_PHOTOS_DST_PATH"
-        apple_photos_dst_path = os.getenv(dst_path, "")
-
-        if not apple_photos_dst_path:
-            raise ValueError(f"'{dst_path}' is not set")
-
-        if not os.path.exists(apple_photos_dst_path):
-            try:
-                os.makedirs(apple_photos_dst_path)
-            except OSError as e:
-                raise OSError(
-                    f"Could not create directory {dst_path}={apple_photos_dst_path}"
-                ) from e
-
-        self.dst_path = Path(apple_photos_dst_path)
+        self.dst_path = _resolve_dst("APPLE_PHOTOS_DST_PATH")
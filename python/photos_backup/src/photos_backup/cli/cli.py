@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 
 import click
 from dotenv import load_dotenv
@@ -12,21 +13,27 @@ from photos_backup.cli.one_drive import one_drive
 HOME = os.path.expanduser("~")
 ENV_PATH = f"{HOME}/.osxphotos.env"
 
-if not os.path.exists(ENV_PATH):
-    raise FileNotFoundError(f"Could not find {ENV_PATH}")
 
-load_dotenv(ENV_PATH)
+@lru_cache(maxsize=1)
+def load_env() -> None:
+    """Load the environment file once, only when a command actually runs."""
+    if not os.path.exists(ENV_PATH):
+        raise FileNotFoundError(f"Could not find {ENV_PATH}")
 
+    load_dotenv(ENV_PATH)
 
-@click.group()
+
+@click.group(
+    commands={
+        "apple-photos": apple_photos,
+        "one-drive": one_drive,
+        "sd-card": sd_card,
+        "ssd": ssd,
+    }
+)
 def cli() -> None:
     """Pass `--help` to any command to see its usage."""
-
-
-cli.add_command(apple_photos)
-cli.add_command(one_drive)
-cli.add_command(sd_card)
-cli.add_command(ssd)
+    load_env()
 
 
 if __name__ == "__main__":
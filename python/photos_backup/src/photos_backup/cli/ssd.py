@@ -14,11 +14,18 @@ from photos_backup.ssd.backup import Backup
     is_flag=True,
     help="Dry run.",
 )
+@click.option(
+    "--parallel/--no-parallel",
+    default=True,
+    help="Whether to run the rsync invocations concurrently.",
+)
 def ssd(
     delete: bool,
     dry_run: bool,
+    parallel: bool,
 ) -> None:
     Backup(
         delete_at_destination=delete,
         dry_run=dry_run,
+        parallel=parallel,
     ).backup()
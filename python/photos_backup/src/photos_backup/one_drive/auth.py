@@ -1,28 +1,50 @@
 import os
-
-import msal
+import time
 
 CLIENT_ID = os.getenv("ONE_DRIVE_CLIENT_ID", "")
 CLIENT_SECRET = os.getenv("ONE_DRIVE_CLIENT_SECRET", "")
 
+# Process-wide cache: client-credential tokens stay valid for about an
+# hour, so re-acquiring one per call would pay a full HTTPS round trip
+# to Azure AD every time. The app object is reused as well.
+_APP = None
+_TOKEN: dict | None = None
+_TOKEN_EXPIRES_AT = 0.0
+_EXPIRY_SKEW = 60  # seconds: refresh a bit before the token expires
+
 
 def acquire_token_func() -> dict:
+    global _APP, _TOKEN, _TOKEN_EXPIRES_AT
+
+    if _TOKEN is not None and time.monotonic() < _TOKEN_EXPIRES_AT:
+        return _TOKEN
+
     if not CLIENT_ID or not CLIENT_SECRET:
         raise ValueError(
             "Could not find required environment variables "
             "to authenticate with OneDrive."
         )
 
-    authority_url = "https://login.microsoftonline.com/common"
-    app = msal.ConfidentialClientApplication(
-        authority=authority_url,
-        client_id=f"{CLIENT_ID}",
-        client_credential=f"{CLIENT_SECRET}",
-    )
-    token = app.acquire_token_for_client(
+    if _APP is None:
+        # deferred so callers failing the env-var check above (and
+        # modules importing this one) don't pay MSAL's import cost
+        import msal
+
+        authority_url = "https://login.microsoftonline.com/common"
+        _APP = msal.ConfidentialClientApplication(
+            authority=authority_url,
+            client_id=f"{CLIENT_ID}",
+            client_credential=f"{CLIENT_SECRET}",
+        )
+    token = _APP.acquire_token_for_client(
         scopes=["https://graph.microsoft.com/.default"]
     )
     if not isinstance(token, dict):
         raise ValueError("Could not acquire token")
 
+    _TOKEN = token
+    _TOKEN_EXPIRES_AT = (
+        time.monotonic() + int(token.get("expires_in", 0)) - _EXPIRY_SKEW
+    )
+
     return token
@@ -1,6 +1,3 @@
-from office365.graph_client import GraphClient
-
-
 class Backup:
     def __init__(self, dry_run: bool) -> None:
         self.dry_run = dry_run
@@ -8,6 +5,10 @@ class Backup:
         self._drive = None
 
         if not dry_run:
+            # deferred: importing the office365 SDK walks a large
+            # dependency tree that dry runs never need
+            from office365.graph_client import GraphClient
+
             from photos_backup.one_drive.auth import acquire_token_func
 
             self._client = GraphClient(acquire_token_func)
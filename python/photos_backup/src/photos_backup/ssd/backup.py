@@ -1,13 +1,15 @@
 import os
-import shlex
 import subprocess
 from pathlib import Path
 
 
 class Backup:
-    def __init__(self, delete_at_destination: bool, dry_run: bool) -> None:
+    def __init__(
+        self, delete_at_destination: bool, dry_run: bool, parallel: bool = True
+    ) -> None:
         self.delete_at_destination = delete_at_destination
         self.dry_run = dry_run
+        self.parallel = parallel
         self.all_photos_path_str: str = ""
         self.all_photos_exclude_file: Path | None = Path()
         self.apple_photos_path_str: str = ""
@@ -17,96 +19,121 @@ class Backup:
         self._set_up_paths()
 
     def backup(self) -> None:
-        dry_run = "--dry-run" if self.dry_run else ""
-        delete = "--delete" if self.delete_at_destination else ""
-        exclude_all_photos = (
-            ""
-            if not self.all_photos_exclude_file
-            else f"--exclude-from={self.all_photos_exclude_file}"
-        )
-        exclude_sd_card = (
-            ""
-            if not self.sd_card_exclude_file
-            else f"--exclude-from={self.sd_card_exclude_file}"
-        )
+        base_cmd = ["rsync", "-avh", "--progress"]
+        if self.delete_at_destination:
+            base_cmd.append("--delete")
+        if self.dry_run:
+            base_cmd.append("--dry-run")
 
+        # rsync accepts several SRC arguments per DEST: group the
+        # sources by the exclude file they need so each group becomes a
+        # single invocation (one fork/exec and startup scan per group
+        # instead of one per source)
+        groups: dict[str, list[str]] = {}
         if self.all_photos_path_str:
-            cmd = f"""rsync -avh --progress {delete} \
-                {dry_run} \
-                {exclude_all_photos} \
-                {self.all_photos_path_str} {self.ssd_dst_path_str}"""
-            subprocess.run(shlex.split(cmd), check=True)
+            exclude = (
+                f"--exclude-from={self.all_photos_exclude_file}"
+                if self.all_photos_exclude_file
+                else ""
+            )
+            groups.setdefault(exclude, []).append(self.all_photos_path_str)
 
         if self.apple_photos_path_str:
-            cmd = f"""rsync -avh --progress {delete} \
-                {dry_run} \
-                {self.apple_photos_path_str} {self.ssd_dst_path_str}"""
-            subprocess.run(shlex.split(cmd), check=True)
+            groups.setdefault("", []).append(self.apple_photos_path_str)
 
         if self.sd_card_path_str:
-            cmd = f"""rsync -avh --progress {delete} \
-                {dry_run} \
-                {exclude_sd_card} \
-                {self.sd_card_path_str} {self.ssd_dst_path_str}"""
-            subprocess.run(shlex.split(cmd), check=True)
+            exclude = (
+                f"--exclude-from={self.sd_card_exclude_file}"
+                if self.sd_card_exclude_file
+                else ""
+            )
+            groups.setdefault(exclude, []).append(self.sd_card_path_str)
+
+        cmds = []
+        for exclude, sources in groups.items():
+            cmd = base_cmd.copy()
+            if exclude:
+                cmd.append(exclude)
+            cmd.extend(sources)
+            cmd.append(self.ssd_dst_path_str)
+            cmds.append(cmd)
+
+        if self.parallel and len(cmds) > 1:
+            # the sources are independent: overlap them so the
+            # destination disk stays busy while one source seeks
+            processes = [subprocess.Popen(cmd) for cmd in cmds]
+            # wait for every process before reporting: raising on the
+            # first failure would leave the siblings running detached
+            # after the caller was already told the backup failed
+            failed = None
+            for process in processes:
+                if process.wait() and failed is None:
+                    failed = process
+            if failed is not None:
+                raise subprocess.CalledProcessError(
+                    failed.returncode, failed.args
+                )
+        else:
+            for cmd in cmds:
+                subprocess.run(cmd, check=True)
 
     def _set_up_paths(self) -> None:
-        all_photos_path_env = "ALL_PHOTOS_PATH"
-        all_photos_path = os.getenv(all_photos_path_env, "")
-        all_photos_exclude_file_env = "ALL_PHOTOS_EXCLUDE_FILE"
-        all_photos_exclude_file_path = os.getenv(all_photos_exclude_file_env, "")
-        apple_photos_path_env = "APPLE_PHOTOS_DST_PATH"
-        apple_photos_path = os.getenv(apple_photos_path_env, "")
-        sd_card_path_env = "SD_CARD_DST_PATH"
-        sd_card_path = os.getenv(sd_card_path_env, "")
-        sd_card_exclude_file_env = "SD_CARD_EXCLUDE_FILE"
-        sd_card_exclude_file = os.getenv(sd_card_exclude_file_env, "")
-        ssd_dst_path_env = "SSD_DST_PATH"
-        ssd_dst_path = os.getenv(ssd_dst_path_env, "")
-
-        for path_env, path_value in zip(
-            [
-                all_photos_path_env,
-                apple_photos_path_env,
-                sd_card_path_env,
-                ssd_dst_path_env,
-            ],
-            [all_photos_path, apple_photos_path, sd_card_path, ssd_dst_path],
+        envs = {
+            name: os.environ.get(name, "")
+            for name in (
+                "ALL_PHOTOS_PATH",
+                "ALL_PHOTOS_EXCLUDE_FILE",
+                "APPLE_PHOTOS_DST_PATH",
+                "SD_CARD_DST_PATH",
+                "SD_CARD_EXCLUDE_FILE",
+                "SSD_DST_PATH",
+            )
+        }
+
+        for env_var_name in (
+            "ALL_PHOTOS_PATH",
+            "APPLE_PHOTOS_DST_PATH",
+            "SD_CARD_DST_PATH",
+            "SSD_DST_PATH",
         ):
-            if not path_value:
-                raise ValueError(f"'{path_env}' is not set")
-
-        if not os.path.exists(ssd_dst_path):
-            try:
-                os.makedirs(ssd_dst_path, exist_ok=True)
-            except OSError as e:
-                raise OSError(
-                    f"Could not create {ssd_dst_path_env} directory: {ssd_dst_path}"
-                ) from e
-
-        if not os.path.exists(all_photos_path):
-            self._print_skip_dir(all_photos_path)
-        else:
+            if not envs[env_var_name]:
+                raise ValueError(f"'{env_var_name}' is not set")
+
+        ssd_dst_path = envs["SSD_DST_PATH"]
+        try:
+            # exist_ok also covers the existing-destination case, no
+            # separate exists() stat needed
+            os.makedirs(ssd_dst_path, exist_ok=True)
+        except OSError as e:
+            raise OSError(
+                f"Could not create SSD_DST_PATH directory: {ssd_dst_path}"
+            ) from e
+
+        all_photos_path = envs["ALL_PHOTOS_PATH"]
+        if os.path.exists(all_photos_path):
             self.all_photos_path_str = all_photos_path
+            exclude_file = envs["ALL_PHOTOS_EXCLUDE_FILE"]
             self.all_photos_exclude_file = (
-                Path(all_photos_exclude_file_path)
-                if os.path.exists(all_photos_exclude_file_path)
-                else None
+                Path(exclude_file) if os.path.exists(exclude_file) else None
             )
-        if not os.path.exists(apple_photos_path):
-            self._print_skip_dir(apple_photos_path)
         else:
-            self.apple_photos_path_str = apple_photos_path
+            self._print_skip_dir(all_photos_path)
 
-        if not os.path.exists(sd_card_path):
-            self._print_skip_dir(sd_card_path)
+        apple_photos_path = envs["APPLE_PHOTOS_DST_PATH"]
+        if os.path.exists(apple_photos_path):
+            self.apple_photos_path_str = apple_photos_path
         else:
+            self._print_skip_dir(apple_photos_path)
+
+        sd_card_path = envs["SD_CARD_DST_PATH"]
+        if os.path.exists(sd_card_path):
             self.sd_card_path_str = sd_card_path
+            exclude_file = envs["SD_CARD_EXCLUDE_FILE"]
             self.sd_card_exclude_file = (
-                Path(sd_card_exclude_file)
-                if os.path.exists(sd_card_exclude_file)
-                else None
+                Path(exclude_file) if os.path.exists(exclude_file) else None
             )
+        else:
+            self._print_skip_dir(sd_card_path)
 
         self.ssd_dst_path_str = ssd_dst_path
 
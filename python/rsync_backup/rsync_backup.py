@@ -3,17 +3,19 @@ Script that uses `rsync` to make a simple and convenient backup.
 Note: requires Python 3.6+. No other Python third-party libraries required.
 """
 import argparse
+import asyncio
 import datetime
-import glob
+import functools
 import json
 import os
 import pathlib
-import subprocess
+import shutil
 
 
-def run_backup():
-    """This is where all the action happens!"""
-    settings = get_settings()
+def run_backup() -> int:
+    """This is where all the action happens! Returns the exit code."""
+    # work on a copy: the cached dict must not see the overrides below
+    settings = dict(get_settings())
 
     # initiate the parser
     parser = argparse.ArgumentParser("backup")
@@ -50,11 +52,11 @@ def run_backup():
             settings["data_sources"] = [arguments.source]
         else:
             print("Please enter a valid source to backup.")
-            exit(0)
+            return 0
 
     # check for --clear or -c
     if arguments.clear:
-        clear_logs(
+        return clear_logs(
             data_sources=settings["data_sources"],
             log_name=settings["log_name"],
         )
@@ -66,108 +68,253 @@ def run_backup():
             settings["data_destination"] = arguments.destination
         else:
             print("Please enter a valid destination.")
-            exit(0)
+            return 0
 
     # don't run the script if the destination doesn't exist
     if not os.path.isdir(settings["data_destination"]):
         print(
             f"The destination doesn't exist.\n({settings['data_destination']})"
         )
-        exit(0)
+        return 0
+
+    # fail fast on misconfigured sources: one stat each up front beats
+    # spawning rsync processes that die partway, and reporting every
+    # bad path at once beats fixing them one run at a time
+    missing_sources = [
+        source
+        for source in settings["data_sources"]
+        if not os.path.isdir(source)
+    ]
+    if missing_sources:
+        print("The following sources don't exist:")
+        for source in missing_sources:
+            print(source)
+        return 2
+
+    check_free_space(settings)
+
+    return backup_all_sources(settings)
+
+
+def check_free_space(settings: dict) -> None:
+    """Compare the total size of the sources against the free space on the
+    destination before any rsync starts and warn when it looks short.
+
+    The total deliberately overestimates: excluded files are counted, and
+    data already present on the destination is transferred incrementally —
+    a routine re-run onto a mostly-full backup disk trips the comparison
+    every time. So a shortfall only prints a warning and the backup
+    proceeds; prompting here would hang (or crash on closed stdin) when
+    the tool runs unattended from a scheduler."""
+    required = 0
+    for source in settings["data_sources"]:
+        for dirpath, _, filenames in os.walk(source):
+            for filename in filenames:
+                try:
+                    required += os.stat(
+                        os.path.join(dirpath, filename),
+                        follow_symlinks=False,
+                    ).st_size
+                except OSError:
+                    # vanished or unreadable: rsync will report it
+                    continue
+
+    free = shutil.disk_usage(settings["data_destination"]).free
+    if free < required:
+        print(
+            f"Warning: the destination may be too small for this backup:\n"
+            f"sources total {required / 1024 ** 3:.1f} GiB, "
+            f"{free / 1024 ** 3:.1f} GiB free on "
+            f"{settings['data_destination']}\n"
+            f"(incremental re-runs usually need far less; "
+            f"rsync will stop if space actually runs out)\n"
+        )
 
-    backup_all_sources(settings)
 
+def backup_all_sources(settings: dict) -> int:
+    """Back up every source, running the independent rsync processes
+    concurrently since each one reads its own source and writes to its
+    own destination directory."""
+    # every source belongs to the same batch, so they share a single
+    # timestamp instead of re-running now()/strftime per source
+    log_stamp = datetime.datetime.now().strftime(settings["log_format"])
 
-def backup_all_sources(settings: dict) -> None:
-    """Iterate over all sources to backup."""
+    all_source_settings = []
     for source in settings["data_sources"]:
-        date_now = datetime.datetime.now()
-        log_format = datetime.datetime.strftime(
-            date_now, settings["log_format"]
-        )
-        log_filename = f"{source}/{settings['log_name']}{log_format}"
-        log_option = f"--log-file={log_filename}"
-
-        backup_source = settings["backup_cmd"].copy()
-        backup_source.extend([log_option])
+        log_filename = f"{source}/{settings['log_name']}{log_stamp}"
+
+        # probe for both per-source filter files with one directory
+        # listing instead of one stat call each
+        filter_names = (settings["backup_include"], settings["backup_exclude"])
+        present = set()
+        with os.scandir(source) as entries:
+            for entry in entries:
+                if entry.name in filter_names:
+                    present.add(entry.name)
+                    if len(present) == len(filter_names):
+                        break
+
+        # one list built in place: the starred copy plus appends beats
+        # copy() followed by repeated extend calls
+        backup_source = [
+            *settings["backup_cmd"],
+            f"--log-file={log_filename}",
+        ]
 
         # files to include in backup that would otherwise be excluded with
         # --exclude-from
-        include_file = f"{source}/{settings['backup_include']}"
-
-        if os.path.exists(include_file):
-            include_option = f"--include-from={include_file}"
-            backup_source.append(include_option)
-
-        # files to ignore in backup
-        exclude_file = f"{source}/{settings['backup_exclude']}"
-
-        if os.path.exists(exclude_file):
-            exclude_option = f"--exclude-from={exclude_file}"
-            backup_source.extend(
-                [exclude_option, source, settings["data_destination"]]
+        if settings["backup_include"] in present:
+            include_file = f"{source}/{settings['backup_include']}"
+            backup_source.append(f"--include-from={include_file}")
+
+        # files to ignore in backup; skipped if no file is found
+        if settings["backup_exclude"] in present:
+            exclude_file = f"{source}/{settings['backup_exclude']}"
+            backup_source.append(f"--exclude-from={exclude_file}")
+
+        # the shipped cache-directory excludes come last so the
+        # per-source filter files above can override them
+        if settings["default_excludes_option"]:
+            backup_source.append(settings["default_excludes_option"])
+
+        backup_source += [source, settings["data_destination"]]
+
+        # each task gets its own copy: the per-source keys would
+        # otherwise be mutated under the feet of running tasks
+        source_settings = dict(settings)
+        source_settings["source"] = source
+        source_settings["backup_source"] = backup_source
+        source_settings["log_filename"] = log_filename
+        all_source_settings.append(source_settings)
+
+    # cap in-flight rsyncs like a worker pool would: starting every
+    # source at once just makes the disks seek against each other
+    max_workers = min(len(all_source_settings), os.cpu_count() or 1) or 1
+
+    async def gather_sources() -> None:
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def run_one(source_settings: dict) -> None:
+            async with semaphore:
+                await backing_source(source_settings)
+
+        await asyncio.gather(
+            *(
+                run_one(source_settings)
+                for source_settings in all_source_settings
             )
-        else:
-            # skips '--exclude-from' option if no file is found
-            backup_source.extend([source, settings["data_destination"]])
-
-        settings["source"] = source
-        settings["backup_source"] = backup_source
-        settings["log_filename"] = log_filename
+        )
 
-        try:
-            backing_source(settings)
-        except KeyboardInterrupt:
-            print("\nKeyboardInterrupt: Exiting operations.")
-            exit(0)
+    try:
+        # a single event loop drives every rsync child: each process is
+        # awaited via the child watcher instead of parking one Python
+        # thread per source in wait()
+        asyncio.run(gather_sources())
+    except KeyboardInterrupt:
+        print("\nKeyboardInterrupt: Exiting operations.")
+        return 0
+    except FileNotFoundError:
+        # propagated out of gather(), which cancels the other sources
+        print(f"FileNotFoundError: Is the `rsync` tool installed?")
+        return 1
+    return 0
 
 
-def backing_source(settings: dict) -> None:
+async def backing_source(settings: dict) -> None:
     """Print information to STDOUT and to `log_filename` and executes the
     rsync command."""
-    print(settings["sep"] * settings["terminal_width"])
+    separator = settings["separator"]
 
     cmd_executed = " ".join(settings["backup_source"])
     msg_executed = f"Command executed:\n{cmd_executed}\n"
+    # no await between these prints, so the block can't interleave with
+    # the other sources sharing the (single-threaded) event loop
+    print(separator)
     print(msg_executed)
 
-    with open(settings["log_filename"], mode="w") as log_file:
-        log_file.write(f"{msg_executed}\n")
-
+    # one open/write/close triple, no BufferedWriter or newline
+    # translation; O_APPEND matches how rsync itself opens the log file
+    # for --log-file, so the preamble safely lands ahead of its lines
+    fd = os.open(
+        settings["log_filename"],
+        os.O_WRONLY | os.O_CREAT | os.O_APPEND,
+        0o644,
+    )
     try:
-        child = subprocess.Popen(settings["backup_source"])
-        _ = child.communicate()[0]  # call communicate to get the return code
-        rc = child.returncode
-    except FileNotFoundError:
-        print(f"FileNotFoundError: Is the `rsync` tool installed?")
-        exit(1)
-
-    print(f"\nBackup completed for: {settings['source']} (return code: {rc})")
-    print(settings["sep"] * settings["terminal_width"])
+        os.write(fd, f"{msg_executed}\n".encode())
+    finally:
+        os.close(fd)
+
+    # rsync inherits stdout/stderr and writes straight to the terminal;
+    # awaiting it yields the loop to the other sources
+    process = await asyncio.create_subprocess_exec(*settings["backup_source"])
+    rc = await process.wait()
+
+    print(
+        f"\nBackup completed for: {settings['source']}"
+        f" (return code: {rc})"
+    )
+    print(separator)
 
 
-def clear_logs(data_sources: list, log_name: str) -> None:
-    """Clears log files for each source specified in SETTINGS."""
+def clear_logs(data_sources: list, log_name: str) -> int:
+    """Clears log files for every source specified in SETTINGS, asking for
+    confirmation once for the whole batch. Returns the exit code."""
+    # Retrieve all matching log files per source: a scandir pass with a
+    # prefix check skips the fnmatch translation and per-entry stat
+    # calls glob would do
+    all_log_files = []
     for source in data_sources:
-        # Retrieve a list of all matching log files in `source`
-        log_files = glob.glob(f"{source}/{log_name}*")
-        if log_files == []:
-            print(f"\nThere is no log file to delete in {source}.")
-            exit(0)
+        try:
+            with os.scandir(source) as entries:
+                log_files = [
+                    (entry.path, entry.name)
+                    for entry in entries
+                    if entry.name.startswith(log_name)
+                    and entry.is_file(follow_symlinks=False)
+                ]
+        except FileNotFoundError:
+            # e.g. a removable drive that isn't mounted right now: no
+            # source directory simply means no log files to delete
+            log_files = []
+        if log_files:
+            all_log_files.append((source, log_files))
         else:
-            print(f"Log files in {source}:")
-            for log_file in log_files:
-                print(log_file)
-            if user_says_yes():
-                for log_file in log_files:
-                    os.remove(log_file)
-                print("Log files deleted.")
+            print(f"\nThere is no log file to delete in {source}.")
+
+    if not all_log_files:
         print("Exiting script...")
-        exit(0)
+        return 0
+
+    # one combined listing and a single prompt, however many sources
+    for source, log_files in all_log_files:
+        print(f"Log files in {source}:")
+        for log_path, _ in log_files:
+            print(log_path)
+
+    if user_says_yes():
+        for source, log_files in all_log_files:
+            # resolve each directory once; each unlink then only looks
+            # up the basename relative to the open fd instead of
+            # re-walking the whole path
+            dir_fd = os.open(source, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                for _, basename in log_files:
+                    try:
+                        os.unlink(basename, dir_fd=dir_fd)
+                    except FileNotFoundError:
+                        # already gone (e.g. removed by hand between
+                        # the listing and the confirmation prompt)
+                        pass
+            finally:
+                os.close(dir_fd)
+        print("Log files deleted.")
+    print("Exiting script...")
+    return 0
 
 
 def user_says_yes(
-    msg: str = "\nDo you want to delete log files for this source? (y/n) ",
+    msg: str = "\nDo you want to delete the listed log files? (y/n) ",
 ) -> bool:
     """Asks the user to enter either "y" or "n" to confirm. Returns boolean."""
     choice = None
@@ -182,23 +329,38 @@ def user_says_yes(
     return choice
 
 
+@functools.lru_cache(maxsize=1)
 def get_settings() -> dict:
     """
-    Get the settings from `settings.json`.
+    Get the settings from `settings.json`, parsing the file only once
+    per process. Callers that mutate the settings must copy the returned
+    dict first (see `run_backup`).
 
     Returns:
         dict: Containing all settings used by the tool.
     """
     directory = pathlib.Path(__file__).parent.absolute()
-    with open(directory / "settings.json") as fp:
-        settings = json.load(fp)
+    settings = json.loads((directory / "settings.json").read_bytes())
 
     backup_cmd = ["rsync"]
     backup_cmd.extend(settings["rsync_options"])
     settings["backup_cmd"] = backup_cmd
 
+    # cache-directory excludes shipped next to this script apply to
+    # every source; resolved once here, appended after the per-source
+    # filter files so those keep precedence (first matching rule wins)
+    settings["default_excludes_option"] = ""
+    default_excludes = directory / settings.get("default_excludes", "")
+    if settings.get("default_excludes") and default_excludes.is_file():
+        settings["default_excludes_option"] = (
+            f"--exclude-from={default_excludes}"
+        )
+
+    # derived once here so per-source code never recomputes it
+    settings["separator"] = settings["sep"] * settings["terminal_width"]
+
     return settings
 
 
 if __name__ == "__main__":
-    run_backup()
+    raise SystemExit(run_backup())
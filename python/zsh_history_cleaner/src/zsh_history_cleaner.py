@@ -58,11 +58,10 @@ Description of available settings in `settings.json`:
                         only one match.
 """
 
+from collections import Counter, deque
 from datetime import datetime
 from pathlib import Path
 import argparse
-import fileinput
-import glob
 import json
 import os
 import re
@@ -70,11 +69,14 @@ import re
 
 def file_length(file_name: str) -> int:
     """Return the number of lines in a file. Returns 0 if it doesn't exist."""
-    num_lines = 0
-    with open(file_name) as file_to_check:
-        for line in file_to_check:
-            line = line.strip("\n")
-            num_lines += 1
+    # Count newline bytes in one C-level scan instead of decoding and
+    # splitting every line in Python. A final line without a trailing
+    # newline still counts as a line, like line iteration did.
+    with open(file_name, "rb") as file_to_check:
+        content = file_to_check.read()
+    num_lines = content.count(b"\n")
+    if content and not content.endswith(b"\n"):
+        num_lines += 1
     return num_lines
 
 
@@ -108,11 +110,41 @@ def user_says_yes(message=""):
     return choice
 
 
+def delete_log_files(log_files: list):
+    """Delete `log_files`, which all live in the same directory. The
+    directory is resolved once and each unlink works on the basename
+    relative to its file descriptor, skipping a full path walk per file."""
+
+    dir_fd = os.open(
+        os.path.dirname(log_files[0]) or ".", os.O_RDONLY | os.O_DIRECTORY
+    )
+    try:
+        for log_file in log_files:
+            os.unlink(os.path.basename(log_file), dir_fd=dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
 def delete_logs(settings: dict, history_file: str):
     """Delete log files in `home_directory` based on `history_file`."""
 
-    # Retrieve a list of all matching log files
-    log_files = glob.glob(f"{history_file}_*.bak")
+    # Retrieve a list of all matching log files: a scandir pass with
+    # prefix/suffix checks on the entry names skips the fnmatch pattern
+    # compilation and the per-entry stat calls glob performs
+    log_dir = os.path.dirname(history_file) or "."
+    log_prefix = f"{os.path.basename(history_file)}_"
+    try:
+        with os.scandir(log_dir) as entries:
+            log_files = [
+                entry.path
+                for entry in entries
+                if entry.name.startswith(log_prefix)
+                and entry.name.endswith(".bak")
+                and entry.is_file(follow_symlinks=False)
+            ]
+    except FileNotFoundError:
+        # a missing home_directory simply means no log files to delete
+        log_files = []
 
     if log_files == []:
         print("There is no log file to delete.")
@@ -123,16 +155,14 @@ def delete_logs(settings: dict, history_file: str):
             print(log_file)
 
         if settings["delete_logs_without_confirming"]:
-            for log_file in log_files:
-                os.remove(log_file)
+            delete_log_files(log_files)
             print("Log files deleted.")
             return
 
         message = "\nDo you want to delete those log files? [y/n] "
 
         if user_says_yes(message=message):
-            for log_file in log_files:
-                os.remove(log_file)
+            delete_log_files(log_files)
             print("Log files deleted.")
             return
 
@@ -140,60 +170,64 @@ def delete_logs(settings: dict, history_file: str):
     return
 
 
-def remove_duplicates_within_range(range_num, history_file):
-    """Scan lines in `history_file` one by one. If the current line is found in
-    the next `range_num` lines, it will be removed. The same process is
-    repeated on every line so that any line won't have duplicates within
-    `range_num`.
+def remove_duplicates_within_range(range_num, lines):
+    """Scan `lines` one by one. If the current line is found in the next
+    `range_num` lines, it will be removed. The same process is repeated on
+    every line so that any line won't have duplicates within `range_num`.
+    Returns the surviving lines.
 
     Note: By executing the script various times, duplicates will be searched
     again and within few executions, no line will be repeated within the
     specified range."""
 
-    file_input = fileinput.FileInput(history_file, inplace=True)
-    with open(history_file, "r") as original_history:
-        original_lines = original_history.readlines()
-    for index, line in enumerate(file_input):
-        next_line = index + 1
-        max_line = next_line + range_num
-        duplicate = False
-        for following_line in range(next_line, max_line):
-            try:
-                if original_lines[following_line][15:] == line[15:]:
-                    duplicate = True
-                    break
-            except IndexError:  # Got to the end of the file, no more lines
-                break
-        if duplicate:
-            continue
-        print(line, end="")
-
-
-def remove_consecutive_duplicates(history_file):
-    """Go over `history_file` in place and for all consecutive lines that are
-    duplicated, skip them (effectively removing them)."""
-
-    file_input = fileinput.FileInput(history_file, inplace=True)
-    previous_line = ""
-    for line in file_input:
-        if previous_line[15:] == line[15:]:
+    # A line is dropped when its key reappears in the next `range_num`
+    # lines, so walk the lines backwards keeping a sliding window of the
+    # keys seen in those lines: one O(N) pass instead of re-scanning up
+    # to `range_num` following lines for every line.
+    window: deque = deque()
+    counts: Counter = Counter()
+    kept = []
+    for line in reversed(lines):
+        key = line[15:]
+        if not counts[key]:
+            kept.append(line)
+        window.append(key)
+        counts[key] += 1
+        if len(window) > range_num:
+            counts[window.popleft()] -= 1
+    kept.reverse()
+    return kept
+
+
+def remove_consecutive_duplicates(lines):
+    """Remove consecutive lines of `lines` that are duplicated, leaving only
+    the first of each run. Returns the surviving lines."""
+
+    kept = []
+    previous_key = None
+    for line in lines:
+        key = line[15:]
+        if key == previous_key:
             continue
-        previous_line = line
-        print(line, end="")
+        previous_key = key
+        kept.append(line)
+    return kept
 
 
-def remove_all_duplicates(history_file):
-    """Go over `history_file` in place and for every line that has been seen
-    before, do not add it back to the file (effectively removing it)."""
+def remove_all_duplicates(lines):
+    """Remove every line of `lines` that has been seen before, keeping only
+    first occurrences. Returns the surviving lines."""
 
     seen = set()
-    file_input = fileinput.FileInput(history_file, inplace=True)
-    for line in file_input:
-        if line[15:] in seen:
+    kept = []
+    for line in lines:
+        key = line[15:]
+        if key in seen:
             continue  # Skip duplicate
 
-        seen.add(line[15:])
-        print(line, end="")
+        seen.add(key)
+        kept.append(line)
+    return kept
 
 
 def load_settings(settings_file: str) -> dict:
@@ -204,16 +238,20 @@ def load_settings(settings_file: str) -> dict:
     return settings
 
 
-def get_list_aliases(zsh_aliases_file: str, settings: dict) -> list:
+def get_list_aliases(zsh_aliases_file: str, settings: dict) -> tuple:
     """Retrieve the name of all the aliases specified in `zsh_aliases_file`.
 
-    Return aliases as a list of strings formatted as regular expressions."""
+    Return a set of aliases to match as whole commands and, when
+    `aliases_match_greedily` is set, a tuple of "alias " prefixes: a hash
+    lookup and a C-level startswith per history line instead of one regular
+    expression per alias."""
 
     match_whole_line = bool(settings["aliases_match_greedily"])
 
     with open(zsh_aliases_file) as file:
         content = file.read().splitlines()  # one alias per line
-        aliases_list = []
+        exact_aliases = set()
+        alias_prefixes = []
         for line in content:
             try:
                 # Get the actual alias in each line
@@ -227,69 +265,83 @@ def get_list_aliases(zsh_aliases_file: str, settings: dict) -> list:
             except AttributeError:
                 continue
 
-            if match_whole_line:
-                # Match the whole line if it starts with the alias.
-                alias = f"^{alias}( )?$|^{alias} .*"
-            else:
-                # Will match only when alias is the whole content of the line,
-                # followed by optional space.
-                alias = f"^{alias}( )?$"
-
-            # Escape dots in alias
-            alias = alias.translate(str.maketrans({".": r"\."}))
+            # Matches when the alias is the whole content of the line
+            # (an optional trailing space is handled at lookup time)
+            exact_aliases.add(alias)
 
-            aliases_list.append(alias)
+            if match_whole_line:
+                # Also match any line that starts with the alias.
+                alias_prefixes.append(f"{alias} ")
 
-    return aliases_list
+    return exact_aliases, tuple(alias_prefixes)
 
 
-def clean_zsh_history(settings: dict, history_file: str):
+def clean_zsh_history(
+    settings: dict,
+    history_file: str,
+    exact_aliases: set = frozenset(),
+    alias_prefixes: tuple = (),
+):
     """Modify in place `history_file` by removing every line where
-    `ignore_patterns` is found.
+    `ignore_patterns` is found, along with every line matching the aliases
+    passed as `exact_aliases`/`alias_prefixes` (see `get_list_aliases`)."""
 
-    Optionally, add a list of aliases to `ignore_patterns` with `aliases` based
-    on the value of `add_aliases` in settings.json."""
-
-    original_num_lines = file_length(history_file)
+    with open(history_file) as file:
+        lines = file.readlines()
+    original_num_lines = len(lines)
 
+    # Same naming fileinput's backup= option produced: the pre-cleanup
+    # file is moved aside and the survivors written fresh
     if settings["backup_history"]:
-        backup_str = generate_date_string()
-        file_input = fileinput.FileInput(
-            history_file, inplace=True, backup=backup_str
-        )
-    else:
-        file_input = fileinput.FileInput(history_file, inplace=True)
-
-    with file_input as file:
-        for line in file:
-            has_match = False
-            for pattern in settings["ignore_patterns"]:
-                matched = re.compile(pattern).search
-                if matched(line[15:]):
-                    has_match = True
-                    break
-            # If no match is found (nothing to ignore), print the line
-            # back into the file. Otherwise, it will be empty.
-            if not has_match:
-                print(line, end="")  # Line already has carriage return
+        os.replace(history_file, history_file + generate_date_string())
+
+    # Union all patterns into one compiled regex so each line costs a
+    # single C-level search instead of one compile + search per pattern
+    patterns = settings["ignore_patterns"]
+    ignore_regex = (
+        re.compile("|".join(f"(?:{pattern})" for pattern in patterns))
+        if patterns
+        else None
+    )
 
+    # Keep a line when no match is found (nothing to ignore). Aliases
+    # are decided with a set lookup and a startswith check; only the
+    # user-supplied patterns need the regex.
+    kept = []
+    for line in lines:
+        command = line[15:].rstrip("\n")
+        # the exact-alias match tolerates one trailing space, as the
+        # previous "^alias( )?$" patterns did
+        exact = command[:-1] if command.endswith(" ") else command
+        if exact in exact_aliases:
+            continue
+        if alias_prefixes and command.startswith(alias_prefixes):
+            continue
+        if ignore_regex is not None and ignore_regex.search(command):
+            continue
+        kept.append(line)
+
+    # Deduplicate the in-memory survivors before the single write below
+    # so the file is never rewritten a second time
     num_lines = settings["remove_duplicates_within_X_lines"]
 
     if settings["remove_all_duplicated_lines"]:
-        remove_all_duplicates(history_file)
+        kept = remove_all_duplicates(kept)
         print("All duplicated lines were removed.")
 
     # if num_lines <= 1 → no need to check (use consecutive instead, if set)
     elif num_lines > 1:
-        remove_duplicates_within_range(num_lines, history_file)
+        kept = remove_duplicates_within_range(num_lines, kept)
         print(f"All duplicates within {num_lines} lines were removed.")
 
     elif settings["remove_consecutive_duplicates"]:
-        remove_consecutive_duplicates(history_file)
+        kept = remove_consecutive_duplicates(kept)
         print("All consecutive duplicated lines were removed.")
 
-    final_num_lines = file_length(history_file)
-    num_lines_deleted = original_num_lines - final_num_lines
+    with open(history_file, "w") as file:
+        file.write("".join(kept))
+
+    num_lines_deleted = original_num_lines - len(kept)
     lines = "line" if num_lines_deleted < 2 else "lines"
 
     print(f"{num_lines_deleted} {lines} deleted.")
@@ -298,18 +350,17 @@ def clean_zsh_history(settings: dict, history_file: str):
 def launch_cleanup(settings: dict, history_file: str, aliases_file: str):
     """Main function that launches the cleanup process."""
 
-    zsh_aliases = None
+    exact_aliases, alias_prefixes = frozenset(), ()
     if settings["add_aliases"]:
         try:
-            zsh_aliases = get_list_aliases(aliases_file, settings)
-
-            # add aliases to list of patterns to ignore
-            settings["ignore_patterns"].extend(zsh_aliases)
+            exact_aliases, alias_prefixes = get_list_aliases(
+                aliases_file, settings
+            )
         except FileNotFoundError:
             print(f"File not found: {aliases_file}")
             quit()
     try:
-        clean_zsh_history(settings, history_file)
+        clean_zsh_history(settings, history_file, exact_aliases, alias_prefixes)
     except FileNotFoundError:
         print(f"File not found: {history_file}")
 